@@ -29,5 +29,9 @@ setup(
         "fake-useragent",
         "requests",
         "aiohttp"
-    ]
+    ],
+    extras_require={
+        "speedups": ["orjson"],
+        "uvloop": ["uvloop; sys_platform != 'win32'"]
+    }
 )
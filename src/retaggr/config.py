@@ -26,6 +26,15 @@ class ReverseSearchConfig:
 
     :param skip_iqdb: Don't instantiate the :class:`IQDB` class.
     :type skip_iqdb: bool
+    :param skip_danbooru: Don't instantiate the :class:`Danbooru` class, even if its keys are set.
+    :type skip_danbooru: bool
+    :param skip_saucenao: Don't instantiate the :class:`SauceNao` class, even if its key is set.
+    :type skip_saucenao: bool
+    :param skip_paheal: Don't instantiate the :class:`Paheal` class.
+    :type skip_paheal: bool
+
+    :param max_concurrent_searches: The maximum amount of engines :meth:`ReverseSearch.reverse_search` searches at the same time. Defaults to 8.
+    :type max_concurrent_searches: int
     """
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
\ No newline at end of file
@@ -2,13 +2,12 @@
 import asyncio
 from collections import namedtuple
 import logging
-import traceback
 
 # Config
 from retaggr.config import ReverseSearchConfig
 
 # Engines
-from retaggr.engines.base import ImageResult
+from retaggr.engines.base import ImageResult, EMPTY_RESULT
 from retaggr.engines.danbooru import Danbooru
 from retaggr.engines.iqdb import Iqdb
 from retaggr.engines.paheal import Paheal
@@ -38,6 +37,20 @@ ReverseResult = namedtuple("ReverseResult", ["tags", "source", "rating"])
 # Set up logger
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+def _has_attributes(config, attributes):
+    """Check if ``config`` has all ``attributes``. Unlike hasattr, a missing attribute doesn't raise and catch an AttributeError."""
+    return all(getattr(config, attribute, _MISSING) is not _MISSING for attribute in attributes)
+
+def _create_saucenao(config):
+    """Create the :class:`SauceNao` engine, enabling the E621 handler if the config allows it."""
+    saucenao = SauceNao(config.saucenao_api_key)
+    if _has_attributes(config, ("e621_username", "app_name", "version")):
+        saucenao.enable_e621(config.e621_username, config.app_name, config.version)
+        logger.info("Activated E621 capabilites on saucenao.")
+    return saucenao
+
 class ReverseSearch:
     r"""Core class used for Reverse Searching. 
     
@@ -46,53 +59,46 @@ class ReverseSearch:
     All listed methods can only be ran from an asynchronous context.
 
     :ivar accessible_engines: The accessible boorus from the passed in configuration object.
+    :ivar max_concurrent_searches: The maximum amount of engine searches :meth:`reverse_search` runs at the same time.
     :param config: The config object.
     :type config: ReverseSearchConfig
     :param test_mode: Enable test mode. Test mode adds two dummy engines that can fail as well as return some very basic values.
     :type test_mode: bool
+    :raises ValueError: ``max_concurrent_searches`` in the config is not an integer of at least 1.
     """
-    _all_engines = [
-        "danbooru",
-        "e621",
-        "iqdb",
-        "paheal",
-        "saucenao"
+    _engine_specs = [
+        ("danbooru", ("danbooru_username", "danbooru_api_key", "min_score"), lambda config: Danbooru(config.danbooru_username, config.danbooru_api_key, config.min_score)),
+        ("iqdb", ("min_score",), lambda config: Iqdb(config.min_score)),
+        ("saucenao", ("saucenao_api_key",), _create_saucenao),
+        ("paheal", (), lambda config: Paheal()),
         ]
+    """Engine registry: the engine name, the config attributes it requires and a factory taking the config object."""
+
+    _all_engines = frozenset(name for name, required, factory in _engine_specs)
 
     def __init__(self, config, test_mode=False):
         self.config = config
         self.accessible_engines = {}
-
-        if hasattr(self.config, "min_score"):
-            if hasattr(self.config, "danbooru_username") and hasattr(self.config, "danbooru_api_key"):
-                self.accessible_engines["danbooru"] = Danbooru(self.config.danbooru_username, self.config.danbooru_api_key, self.config.min_score)
-                logger.info("Created Danbooru engine")
-
-            # IQDB stuff -> we do the check _first_ since someone might not specify this at all, in which case we do still instantiate it.
-            if hasattr(self.config, "skip_iqdb") and self.config.skip_iqdb:
-                skip_iqdb = True
-            else:
-                skip_iqdb = False
-            if not skip_iqdb:
-                self.accessible_engines["iqdb"] = Iqdb(self.config.min_score)
-                logger.info("Created IQDB engine")
-
-        if hasattr(self.config, "saucenao_api_key"):
-            self.accessible_engines["saucenao"] = SauceNao(self.config.saucenao_api_key)
-            logger.info("Created SauceNao engine")
-            if hasattr(self.config, "e621_username") and hasattr(self.config, "app_name") and hasattr(self.config, "version"):
-                self.accessible_engines["saucenao"].enable_e621(self.config.e621_username, self.config.app_name, self.config.version)
-                logger.info("Activated E621 capabilites on saucenao.")
-
-        self.accessible_engines["paheal"] = Paheal()
+        self.max_concurrent_searches = getattr(self.config, "max_concurrent_searches", 8)
+        if not isinstance(self.max_concurrent_searches, int) or self.max_concurrent_searches < 1:
+            raise ValueError("max_concurrent_searches must be an integer of at least 1, got %r" % (self.max_concurrent_searches,))
+        self._search_semaphore = None
+        self._search_semaphore_loop = None
+
+        for name, required, factory in self._engine_specs:
+            # skip_<engine> lets someone opt out of an engine that would otherwise be instantiated (eg. skip_iqdb).
+            if getattr(self.config, "skip_" + name, False):
+                continue
+            if _has_attributes(self.config, required):
+                self.accessible_engines[name] = factory(self.config)
+                logger.info("Created %s engine", name)
 
         if test_mode:
             self.accessible_engines["dummy"] = Dummy(False)
             self.accessible_engines["fail_dummy"] = Dummy(True)
-            self._all_engines.append("dummy")
-            self._all_engines.append("fail_dummy")
+            self._all_engines = self._all_engines | {"dummy", "fail_dummy"}
 
-    async def reverse_search(self, url, callback=None, download=False):
+    async def reverse_search(self, url, callback=None, download=False, first_match=False):
         """
         Reverse searches all accessible boorus for ``url``.
 
@@ -104,7 +110,7 @@ class ReverseSearch:
                :linenos:
 
                 async def callback(engine, rresult):
-                    print("This booru was searched: %s", booru)
+                    print("This engine was searched: %s", engine)
                     print("These tags were found: %s", rresult.tags)
                     print("This source was found: %s", rresult.source)
                     print("This rating was found: %s", rresult.rating)
@@ -120,6 +126,8 @@ class ReverseSearch:
         :type callback: Optional[function]
         :param download: Run searches on boorus that require a file download. Defaults to False.
         :type download: Optional[bool]
+        :param first_match: Stop as soon as an engine finds any tags and cancel the remaining searches. The result also contains whatever the engines that finished before it found. Defaults to False.
+        :type first_match: Optional[bool]
         :return: A :class:`ReverseResult` instance containing your data.
         :rtype: ReverseResult
         """
@@ -133,30 +141,51 @@ class ReverseSearch:
                 if not download:
                     logger.info("[%s] Downloading files has been disabled. Skipping [%s]", url, engine)
                     continue
-            tasks.append(self._gather_reverse_task(engine, url, callback))
-        results = await asyncio.gather(*tasks)
+            tasks.append(asyncio.ensure_future(self._gather_reverse_task(engine, url, callback)))
+
+        if first_match:
+            try:
+                for future in asyncio.as_completed(tasks):
+                    try:
+                        result = await future
+                    except Exception: # pragma: no cover
+                        logger.warning("[%s] An engine has failed!", url, exc_info=True)
+                        continue
+                    tags.update(result.tags)
+                    source.update(result.source)
+                    if result.rating:
+                        rating.add(result.rating)
+                    if tags:
+                        break
+            finally:
+                # Nothing left to wait for, so don't leave the slower engines running.
+                for task in tasks:
+                    task.cancel()
+            return ReverseResult(tags, source, rating)
+
+        # return_exceptions keeps a single failing task (eg. a broken callback) from aborting the whole batch.
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         for result in results:
             if isinstance(result, Exception): # pragma: no cover
                 logger.warning("[%s] An engine has failed!", url)
-                logger.warning("[%s] This may or may not be an issue. Report it on the issue tracker: https://github.com/noirscape/retaggr/issues if the issue persists.", url)
-                traceback.print_exc()
+                logger.warning("[%s] This may or may not be an issue. Report it on the issue tracker: https://github.com/noirscape/retaggr/issues if the issue persists.", url, exc_info=result)
                 continue
-            if result.tags:
-                tags.update(result.tags)
-            if result.source:
-                source.update(result.source)
+            tags.update(result.tags)
+            source.update(result.source)
             if result.rating:
                 rating.add(result.rating)
         return ReverseResult(tags, source, rating)
 
     async def _gather_reverse_task(self, engine, url, callback) -> ImageResult:
         """Underlying method used to run reverse_search more asynchronously."""
-        logger.info("[%s] Starting search in [%s] engine", url, engine)
         try:
-            result = await self.search_image(engine, url)
-        except: # pragma: no cover
+            async with self._get_search_semaphore():
+                logger.info("[%s] Starting search in [%s] engine", url, engine)
+                result = await self.search_image(engine, url)
+        except Exception: # pragma: no cover
             # reverse_search just can't except, it's meant to keep trucking no matter what.
-            return ImageResult([], None, None)
+            logger.warning("[%s] Searching [%s] failed, skipping it.", url, engine, exc_info=True)
+            return EMPTY_RESULT
         else:
             logger.info("[%s][%s] Found tags: %s", url, engine, result.tags)
             logger.info("[%s][%s] Found source: %s", url, engine, result.source)
@@ -167,6 +196,16 @@ class ReverseSearch:
         logger.info("[%s] Finished searching [%s]", url, engine)
         return result
 
+    def _get_search_semaphore(self):
+        """Get the semaphore limiting concurrent searches, creating a new one whenever the running event loop changes.
+
+        A semaphore can only be used from a single event loop, and every ``asyncio.run()`` call starts a new one."""
+        loop = asyncio.get_running_loop()
+        if self._search_semaphore is None or self._search_semaphore_loop is not loop:
+            self._search_semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+            self._search_semaphore_loop = loop
+        return self._search_semaphore
+
     async def search_image(self, booru, url):
         r"""Reverse search a booru for ``url``.
 
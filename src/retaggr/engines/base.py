@@ -1,17 +1,38 @@
 import datetime
 import asyncio
+import threading
 from collections import namedtuple
 
+import requests
+
+class ThreadLocalSession(threading.local):
+    """Keeps one :class:`requests.Session` per thread for the engines and handlers that fall back on ``requests``.
+
+    Reusing a session keeps connections alive, so repeated searches don't redo the TCP and TLS handshake.
+    ``requests`` doesn't guarantee that a session is thread-safe, and these requests run in executor threads,
+    so every thread gets its own. Each engine or handler should own its own instance so cookies aren't shared between them.
+    """
+    def __init__(self):
+        self.session = requests.Session()
+
+    def get(self, *args, **kwargs):
+        """Same as :meth:`requests.Session.get`, using this thread's session."""
+        return self.session.get(*args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        """Same as :meth:`requests.Session.post`, using this thread's session."""
+        return self.session.post(*args, **kwargs)
+
 ImageResult = namedtuple("ImageResult", ["tags", "source", "rating"])
 """The response from the engine.
 
 .. py:attribute:: tags
 
-    The tags the engine has located.
+    A frozenset of the tags the engine has located.
 
 .. py:attribute:: source
 
-    The sources that have been found for the image.
+    A frozenset of the sources that have been found for the image.
 
 .. py:attribute:: rating
 
@@ -19,6 +40,9 @@ ImageResult = namedtuple("ImageResult", ["tags", "source", "rating"])
 
 """
 
+EMPTY_RESULT = ImageResult(frozenset(), frozenset(), None)
+"""An :class:`ImageResult` without any findings. Return this rather than ``None`` so results can always be merged."""
+
 
 class Engine:
     """Base class for an engine.
@@ -1,8 +1,7 @@
-from retaggr.engines.base import Engine, ImageResult
+from retaggr.engines.base import Engine, ImageResult, ThreadLocalSession
 
 # External modules
 import asyncio
-import requests as fuck_aiohttp
 import functools
 
 class Danbooru(Engine):
@@ -24,15 +23,16 @@ class Danbooru(Engine):
         self.min_score = min_score
         self.username = username
         self.api_key = api_key
+        self.session = ThreadLocalSession()
 
     async def search_image(self, url):
-        tags = []
-        source = []
+        tags = frozenset()
+        source = frozenset()
         rating = None
 
         iqdb_url = self.host + "/iqdb_queries.json"
         loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.get, iqdb_url, params={"url":url}, auth=(self.username, self.api_key)))
+        r = await loop.run_in_executor(None, functools.partial(self.session.get, iqdb_url, params={"url":url}, auth=(self.username, self.api_key)))
         json = r.json()
         if 'success' in json:
             if not json['success']: # pragma: no cover
@@ -40,7 +40,7 @@ class Danbooru(Engine):
 
         if len(json) > 0:
             if json[0]['score'] > self.min_score:
-                tags = json[0]["post"]["tag_string"].split()
-                source.append(json[0]["post"]["source"])
+                tags = frozenset(json[0]["post"]["tag_string"].split())
+                source = frozenset([json[0]["post"]["source"]])
                 rating = json[0]["post"]["rating"]
         return ImageResult(tags, source, rating)
\ No newline at end of file
@@ -2,7 +2,6 @@ from retaggr.engines.base import Engine, ImageResult
 
 # External modules
 import asyncio
-import requests as fuck_aiohttp
 import functools
 
 class Dummy(Engine):
@@ -18,4 +17,4 @@ class Dummy(Engine):
         if self.fail:
             raise Exception("Task failed (intentional)")
         else:
-            return ImageResult(["test"], ["test"], "safe")
\ No newline at end of file
+            return ImageResult(frozenset(["test"]), frozenset(["test"]), "safe")
\ No newline at end of file
@@ -1,10 +1,9 @@
-from retaggr.engines.base import Engine, ImageResult
+from retaggr.engines.base import Engine, ImageResult, ThreadLocalSession
 from retaggr.errors import NotAvailableSearchException
 
 # External imports
 import asyncio
 import functools
-import requests as fuck_aiohttp
 from fake_useragent import UserAgent
 from lxml import html
 
@@ -25,13 +24,14 @@ class Iqdb(Engine):
     def __init__(self, min_score):
         self.min_score = min_score
         self.ua = UserAgent()
+        self.session = ThreadLocalSession()
 
     async def search_image(self, url):
         tags = []
 
         params = {"url" : url}
         loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.post, self.host, headers={"User-Agent": self.ua.random}, params=params))
+        r = await loop.run_in_executor(None, functools.partial(self.session.post, self.host, headers={"User-Agent": self.ua.random}, params=params))
 
         doc = html.fromstring(r.text)
         tables = doc.xpath("//div[@id='pages']/div/table/tr/td")
@@ -60,7 +60,7 @@ class Iqdb(Engine):
                 pass
             row = row + 6
 
-        return ImageResult(tags, [], None)
+        return ImageResult(frozenset(tags), frozenset(), None)
 
     async def search_tag(self, tag):
         """Reverse search the booru for tag data.
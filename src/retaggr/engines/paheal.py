@@ -33,7 +33,7 @@ class Paheal(Engine):
             for tag in post.attrib["tags"].split(): 
                 tags.append(tag.lower())
             source.append(post.attrib["source"])
-        return ImageResult(tags, source, None)
+        return ImageResult(frozenset(tags), frozenset(source), None)
 
     async def search_tag(self, tag):
         """Reverse search the booru for tag data.
@@ -1,25 +1,42 @@
 import datetime
 import asyncio
-import functools
+import logging
+import time
+from collections import OrderedDict
 
-from retaggr.engines.base import Engine, ImageResult
+try:
+    from orjson import loads as json_loads
+except ImportError: # pragma: no cover
+    from json import loads as json_loads
+
+from retaggr.aiohttp_requests import requests
+from retaggr.engines.base import Engine, ImageResult, EMPTY_RESULT
 from retaggr.engines.saucenao.handlers import DanbooruHandler, E621Handler, KonachanHandler, YandereHandler
 from retaggr.errors import NotAvailableSearchException, EngineCooldownException
-import requests as fuck_aiohttp
+
+# Set up logger
+logger = logging.getLogger(__name__)
 
 class SauceNao(Engine):
     """Reverse searches the SauceNao API and then does additional matching.
 
     This booru does not require images to be downloaded before searching.
 
-    This API is subject to rate limits.
+    This API is subject to rate limits. To stay clear of them, the API responses for the last :attr:`cache_size`
+    searched URLs are kept in memory for :attr:`cache_ttl` seconds.
 
+    :ivar cache_size: The maximum amount of API responses that are cached.
+    :vartype cache_size: int
+    :ivar cache_ttl: The amount of seconds a cached API response stays valid.
+    :vartype cache_ttl: float
     :param api_key: SauceNao API key. You can get this by registering an account on saucenao.com
     :type api_key: str
     :param test_mode: Enable test mode. Test mode is unique in that it does not need an API key, but it only works on one URL.
     """
     host = "https://saucenao.com"
     download_required = False
+    cache_size = 256
+    cache_ttl = 3600
 
     def __init__(self, api_key, test_mode=False):
         self.api_key = api_key
@@ -29,6 +46,7 @@ class SauceNao(Engine):
             YandereHandler.engine_id : YandereHandler(),
         }
         self.test_mode = test_mode
+        self._cache = OrderedDict()
 
     def enable_e621(self, username, app_name, version):
         """Enable the E621 parser. This allows for looking up tag information on E621.
@@ -60,13 +78,45 @@ class SauceNao(Engine):
                 "url": "http://saucenao.com/images/static/banner.gif"
             }
 
-        loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.get, request_url, params=params))
-        j = r.json()
-        if r.status_code == 200:
-            return await self.index_parser(j)
-        elif r.status_code == 429: # pragma: no cover
-            raise EngineCooldownException()
+        # aiohttp refuses None values, unlike requests which silently dropped them (eg. a missing API key).
+        params = {key: value for key, value in params.items() if value is not None}
+
+        json = self._get_cached(params["url"])
+        if json is None:
+            r = await requests.get(request_url, params=params)
+            if r.status != 200: # pragma: no cover
+                # The body is never read here, so hand the connection back to the shared session ourselves.
+                r.release()
+                if r.status == 429:
+                    raise EngineCooldownException()
+                return EMPTY_RESULT
+            json = json_loads(await r.read())
+            self._set_cached(params["url"], json)
+        return await self.index_parser(json)
+
+    def _get_cached(self, url):
+        """Get the cached API response for ``url``, or None if it isn't cached or has expired."""
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        timestamp, json = entry
+        if time.time() - timestamp > self.cache_ttl:
+            del self._cache[url]
+            return None
+        self._cache.move_to_end(url)
+        return json
+
+    def _set_cached(self, url, json):
+        """Cache the API response for ``url``, evicting the least recently used response if the cache is full."""
+        self._cache[url] = (time.time(), json)
+        self._cache.move_to_end(url)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _handler_lookup(self, lock, lookup, data):
+        """Run a handler lookup while holding ``lock``, so a handler's host only gets one request at a time."""
+        async with lock:
+            return await lookup(data)
 
     async def search_tag(self, tag):
         raise NotAvailableSearchException("This engine cannot search tags.")
@@ -79,29 +129,40 @@ class SauceNao(Engine):
         :return: Dictionary containing data that matches the output for :meth:`SauceNao.search_image_source`
         :rtype: ImageResult
         """
-        base_similarity = json["header"]["minimum_similarity"] # Grab the minimum similarity saucenao advises, going lower is generally gonna give false positives.
-
-        # Below we cast the _entry_ similarity to a float since somehow it's stored as an str.
-        # Damn API inaccuracy
-        valid_results = [entry for entry in json["results"] if float(entry["header"]["similarity"]) > base_similarity]
-
-        # Test mode similarity override
-        if self.test_mode:
+        if self.test_mode: # Test mode similarity override
             valid_results = json["results"]
+        else:
+            base_similarity = json["header"]["minimum_similarity"] # Grab the minimum similarity saucenao advises, going lower is generally gonna give false positives.
+
+            # Below we cast the _entry_ similarity to a float since somehow it's stored as an str.
+            # Damn API inaccuracy
+            # Filtered lazily, so the results are only walked once.
+            valid_results = (entry for entry in json["results"] if float(entry["header"]["similarity"]) > base_similarity)
 
-        # Kinda looks stupid, but whatever.
-        loop = asyncio.get_event_loop()
         source = set()
         tags = set()
+        tag_lookups = []
+        source_lookups = []
+        handler_locks = {}
         for entry in valid_results:
             if "ext_urls" in entry["data"]: # Some of these responses dont have ext_url...
-                for url in entry["data"]["ext_urls"]:
-                    source.add(url)
+                source.update(entry["data"]["ext_urls"])
             handler = self.handlers.get(entry["header"]["index_id"], None)
             if handler:
+                lock = handler_locks.setdefault(handler.engine_id, asyncio.Lock())
                 if handler.tag_capable:
-                    tags.update(await handler.get_tag_data(entry["data"]))
+                    tag_lookups.append(self._handler_lookup(lock, handler.get_tag_data, entry["data"]))
                 if handler.source_capable:
-                    source.update(await handler.get_source_data(entry["data"]))
-
-        return ImageResult(tags, source, None)
\ No newline at end of file
+                    source_lookups.append(self._handler_lookup(lock, handler.get_source_data, entry["data"]))
+
+        # Every handler lookup is its own HTTP request, so different hosts are queried at the same time.
+        found = await asyncio.gather(*tag_lookups, *source_lookups, return_exceptions=True)
+        for index, result in enumerate(found):
+            if isinstance(result, Exception):
+                logger.warning("A SauceNao handler lookup failed, skipping it.", exc_info=result)
+            elif index < len(tag_lookups):
+                tags.update(result)
+            else:
+                source.update(result)
+
+        return ImageResult(frozenset(tags), frozenset(source), None)
\ No newline at end of file
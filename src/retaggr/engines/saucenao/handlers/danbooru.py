@@ -1,7 +1,7 @@
 import asyncio
 import functools
 
-import requests as fuck_aiohttp
+from retaggr.engines.base import ThreadLocalSession
 
 from .base import SauceNaoHandler
 
@@ -15,15 +15,18 @@ class DanbooruHandler(SauceNaoHandler):
     source_capable = True
     """"""
 
+    session = ThreadLocalSession()
+    """"""
+
 
     async def get_tag_data(self, data):
         loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.get, "https://danbooru.donmai.us/posts/" + str(data["danbooru_id"]) + ".json"))
+        r = await loop.run_in_executor(None, functools.partial(self.session.get, "https://danbooru.donmai.us/posts/" + str(data["danbooru_id"]) + ".json"))
         j = r.json()
         return set(j["tag_string"].split())
 
     async def get_source_data(self, data):
         loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.get, "https://danbooru.donmai.us/posts/" + str(data["danbooru_id"]) + ".json"))
+        r = await loop.run_in_executor(None, functools.partial(self.session.get, "https://danbooru.donmai.us/posts/" + str(data["danbooru_id"]) + ".json"))
         j = r.json()
         return set([j["source"]])
\ No newline at end of file
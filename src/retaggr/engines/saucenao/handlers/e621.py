@@ -2,8 +2,6 @@ import asyncio
 import functools
 import time
 
-import requests as fuck_aiohttp
-
 from .base import SauceNaoHandler
 from retaggr.aiohttp_requests import requests
 
@@ -1,7 +1,7 @@
 import asyncio
 import functools
 
-import requests as fuck_aiohttp
+from retaggr.engines.base import ThreadLocalSession
 
 from .base import SauceNaoHandler
 
@@ -15,9 +15,12 @@ class KonachanHandler(SauceNaoHandler):
     source_capable = False
     """"""
 
+    session = ThreadLocalSession()
+    """"""
+
 
     async def get_tag_data(self, data):
         loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.get, "http://konachan.com/post.json", params={"tags": "id:" + str(data["konachan_id"])}))
+        r = await loop.run_in_executor(None, functools.partial(self.session.get, "http://konachan.com/post.json", params={"tags": "id:" + str(data["konachan_id"])}))
         j = r.json()
         return set(j[0]["tags"].split())
\ No newline at end of file
@@ -1,7 +1,7 @@
 import asyncio
 import functools
 
-import requests as fuck_aiohttp
+from retaggr.engines.base import ThreadLocalSession
 
 from .base import SauceNaoHandler
 
@@ -15,8 +15,11 @@ class YandereHandler(SauceNaoHandler):
     source_capable = False
     """"""
 
+    session = ThreadLocalSession()
+    """"""
+
     async def get_tag_data(self, data):
         loop = asyncio.get_event_loop()
-        r = await loop.run_in_executor(None, functools.partial(fuck_aiohttp.get, "https://yande.re/post.json", params={"tags": "id:" + str(data["yandere_id"])}))
+        r = await loop.run_in_executor(None, functools.partial(self.session.get, "https://yande.re/post.json", params={"tags": "id:" + str(data["yandere_id"])}))
         j = r.json()
         return set(j[0]["tags"].split())
\ No newline at end of file
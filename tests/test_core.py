@@ -1,6 +1,7 @@
 import pytest
 import retaggr
 import os
+import asyncio
 
 # Logging
 import logging
@@ -64,3 +65,74 @@ async def test_reverse_search_callback():
         calls += 1
     await core.reverse_search("https://iris.paheal.net/_images/f0a277f7c4e80330b843f8002daf627e/1876780%20-%20Dancer_of_the_Boreal_Valley%20Dark_Souls%20Dark_Souls_3%20Sinensian.jpg", callback=callback, download=True)
     assert calls > 0
+
+@pytest.mark.asyncio
+async def test_reverse_search_first_match():
+    core = retaggr.ReverseSearch(retaggr.ReverseSearchConfig(), True)
+    result = await core.reverse_search("irrelevant", first_match=True)
+    assert result.tags == {"test"}
+
+class SlowEngine(retaggr.engines.Engine):
+    download_required = False
+
+    def __init__(self, result, delay):
+        self.result = result
+        self.delay = delay
+        self.cancelled = False
+
+    async def search_image(self, url):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.result
+
+def core_with_engines(**engines):
+    core = retaggr.ReverseSearch(retaggr.ReverseSearchConfig(skip_paheal=True))
+    core.accessible_engines = engines
+    core._all_engines = frozenset(engines)
+    return core
+
+@pytest.mark.asyncio
+async def test_reverse_search_first_match_cancels_slower_engines():
+    slow = SlowEngine(retaggr.ImageResult(frozenset(["slow"]), frozenset(), None), 10)
+    core = core_with_engines(fast=SlowEngine(retaggr.ImageResult(frozenset(["fast"]), frozenset(), None), 0), slow=slow)
+    result = await core.reverse_search("irrelevant", first_match=True)
+    await asyncio.sleep(0) # Let the cancellation reach the slow engine
+    assert result.tags == {"fast"}
+    assert slow.cancelled
+
+@pytest.mark.asyncio
+async def test_reverse_search_first_match_without_tags():
+    core = core_with_engines(
+        first=SlowEngine(retaggr.ImageResult(frozenset(), frozenset(["https://example.com/a"]), "safe"), 0),
+        second=SlowEngine(retaggr.ImageResult(frozenset(), frozenset(["https://example.com/b"]), None), 0.01),
+    )
+    result = await core.reverse_search("irrelevant", first_match=True)
+    assert result.tags == set()
+    assert result.source == {"https://example.com/a", "https://example.com/b"}
+    assert result.rating == {"safe"}
+
+def test_reverse_search_reused_across_event_loops():
+    core = core_with_engines(
+        first=SlowEngine(retaggr.ImageResult(frozenset(["first"]), frozenset(), None), 0.01),
+        second=SlowEngine(retaggr.ImageResult(frozenset(["second"]), frozenset(), None), 0.01),
+    )
+    core.max_concurrent_searches = 1
+    for _ in range(2): # Every asyncio.run() call creates a new event loop
+        result = asyncio.run(core.reverse_search("irrelevant"))
+        assert result.tags == {"first", "second"}
+
+@pytest.mark.asyncio
+async def test_reverse_search_engine_returning_lists():
+    for first_match in (False, True):
+        core = core_with_engines(lists=SlowEngine(retaggr.ImageResult(["a"], ["b"], None), 0))
+        result = await core.reverse_search("irrelevant", first_match=first_match)
+        assert result.tags == {"a"}
+        assert result.source == {"b"}
+
+@pytest.mark.parametrize("max_concurrent_searches", [0, -1, None, "8"])
+def test_core_creation_invalid_max_concurrent_searches(max_concurrent_searches):
+    with pytest.raises(ValueError):
+        retaggr.ReverseSearch(retaggr.ReverseSearchConfig(max_concurrent_searches=max_concurrent_searches))
@@ -1,8 +1,11 @@
 import os
+import asyncio
+import time
 import pytest
 import retaggr
 import retaggr.engines.saucenao.handlers as handlers
 from retaggr.engines import SauceNao
+import retaggr.engines.saucenao.engine as saucenao_engine
 
 e621_username = os.environ.get('E621_USERNAME', None)
 app_name = os.environ.get('APP_NAME', None)
@@ -57,3 +60,88 @@ async def test_saucenao_tag():
     engine = SauceNao(None, True)
     with pytest.raises(retaggr.NotAvailableSearchException):
         await engine.search_tag("doesnt matter")
+
+def cached_response(similarity="90.0"):
+    return {
+        "header": {"minimum_similarity": 50.0},
+        "results": [{"header": {"similarity": similarity, "index_id": 0}, "data": {"ext_urls": ["https://example.com/source"]}}]
+    }
+
+@pytest.mark.asyncio
+async def test_saucenao_cache_hit():
+    engine = SauceNao(None)
+    engine._cache["https://example.com/a.png"] = (time.time(), cached_response())
+    answer = await engine.search_image("https://example.com/a.png") # Served from the cache, so no request is made.
+    assert answer.source == {"https://example.com/source"}
+
+def test_saucenao_cache_eviction():
+    engine = SauceNao(None)
+    engine.cache_size = 2
+    engine._set_cached("a", cached_response())
+    engine._set_cached("b", cached_response())
+    assert engine._get_cached("a") is not None # Marks "a" as recently used
+    engine._set_cached("c", cached_response())
+    assert list(engine._cache) == ["a", "c"]
+    assert engine._get_cached("b") is None
+
+def test_saucenao_cache_expiry():
+    engine = SauceNao(None)
+    engine.cache_ttl = 0
+    engine._cache["a"] = (time.time() - 10, cached_response())
+    assert engine._get_cached("a") is None
+    assert "a" not in engine._cache
+
+class FakeHandler(handlers.base.SauceNaoHandler):
+    engine_id = 999
+    tag_capable = True
+    source_capable = True
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def get_tag_data(self, data):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if data["fake_id"] == 2:
+            raise Exception("Lookup failed (intentional)")
+        return {"tag_%d" % data["fake_id"]}
+
+    async def get_source_data(self, data):
+        return await self.get_tag_data(data)
+
+@pytest.mark.asyncio
+async def test_saucenao_handler_lookups():
+    engine = SauceNao(None)
+    handler = FakeHandler()
+    engine.handlers[FakeHandler.engine_id] = handler
+    json = {
+        "header": {"minimum_similarity": 50.0},
+        "results": [{"header": {"similarity": "90.0", "index_id": 999}, "data": {"fake_id": fake_id, "ext_urls": ["https://example.com/%d" % fake_id]}} for fake_id in range(3)]
+    }
+    answer = await engine.index_parser(json)
+    assert handler.max_running == 1 # A single host never gets more than one request at a time
+    assert answer.tags == {"tag_0", "tag_1"} # The failing lookup is skipped
+    assert "https://example.com/2" in answer.source
+
+class FakeResponse:
+    status = 200
+
+    async def read(self):
+        return b'{"header": {"minimum_similarity": 50.0}, "results": []}'
+
+@pytest.mark.asyncio
+async def test_saucenao_without_api_key(monkeypatch):
+    sent_params = {}
+    class FakeRequests:
+        async def get(self, url, params):
+            sent_params.update(params)
+            return FakeResponse()
+    monkeypatch.setattr(saucenao_engine, "requests", FakeRequests())
+
+    engine = SauceNao(None)
+    await engine.search_image("https://example.com/a.png")
+    assert "api_key" not in sent_params
+    assert sent_params["url"] == "https://example.com/a.png"